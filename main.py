@@ -1,18 +1,24 @@
 import os
+import re
+import shutil
 import requests
 from datetime import datetime, timezone, timedelta
 import json
-from typing import Generator, Dict, Any, Optional
+from typing import Generator, Dict, Any, Optional, Callable
 import time
 import click
 import csv
 from bs4 import BeautifulSoup
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+CONVERSATION_STATUSES = ['all', 'active', 'closed', 'open', 'pending', 'spam']
+
 @click.group()
 def cli():
     """Help Scout API client"""
@@ -22,12 +28,24 @@ class HelpScoutAPI:
     BASE_URL = 'https://api.helpscout.net/v2'
     AUTH_URL = 'https://api.helpscout.net/v2/oauth2/token'
     
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        token_file: str = '.helpscout_token.json',
+        requests_per_minute: Optional[int] = None
+    ):
         self.client_id = client_id
         self.client_secret = client_secret
         self.session = requests.Session()
         self.access_token = None
-        self.token_file = '.helpscout_token.json'
+        self.token_file = token_file
+        # Optional per-client request budget, independent of other clients
+        self.min_request_interval = 60.0 / requests_per_minute if requests_per_minute else 0
+        self._last_request_at = 0.0
+        self._throttle_lock = threading.Lock()
+        # Serialises token refreshes when the client is shared between threads
+        self._auth_lock = threading.Lock()
         self._load_or_refresh_token()
 
     def _load_or_refresh_token(self):
@@ -37,9 +55,11 @@ class HelpScoutAPI:
         try:
             with open(self.token_file, 'r') as f:
                 token_data = json.load(f)
-                # Check if token is still valid (expires in 2 days)
+                # Check if token is still valid (expires in 2 days) and
+                # belongs to these credentials
                 expires_at = datetime.fromisoformat(token_data['expires_at'])
-                if expires_at > datetime.now(timezone.utc):
+                if (expires_at > datetime.now(timezone.utc)
+                        and token_data.get('client_id') == self.client_id):
                     self.access_token = token_data['access_token']
                     self.session.headers.update({
                         'Authorization': f'Bearer {self.access_token}',
@@ -80,6 +100,7 @@ class HelpScoutAPI:
 
         # Save token with expiration time (2 days from now)
         token_data = {
+            'client_id': self.client_id,
             'access_token': self.access_token,
             'expires_at': (datetime.now(timezone.utc) + 
                          timedelta(days=2)).isoformat()
@@ -92,19 +113,41 @@ class HelpScoutAPI:
         Handle API response, including re-authentication if token expires.
         """
         if response.status_code == 401:
-            # Token might have expired, try to re-authenticate
-            self._load_or_refresh_token()
+            # Token might have expired, try to re-authenticate. Only the first
+            # thread to see the rejected token refreshes it; the others reuse
+            # the new one.
+            with self._auth_lock:
+                if response.request.headers.get('Authorization') == self.session.headers.get('Authorization'):
+                    self._authenticate()
             # Update the request with new token and retry
             response.request.headers['Authorization'] = self.session.headers['Authorization']
             return self.session.send(response.request)
         return response
 
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Send a GET request, spacing requests out to stay within this client's budget.
+        """
+        if self.min_request_interval:
+            with self._throttle_lock:
+                wait = self._last_request_at + self.min_request_interval - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                self._last_request_at = time.monotonic()
+
+        response = self.session.get(url, params=params)
+        return self._handle_response(response)
+
     def get_conversations(
         self,
         created_from: datetime,
         created_to: Optional[datetime] = None,
         tags: Optional[list[str]] = None,
-        status: str = 'all'
+        status: str = 'all',
+        mailbox_id: Optional[int] = None,
+        confirm: bool = True,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        on_failure: Optional[Callable[[int, Exception], None]] = None
     ) -> Generator[Dict[str, Any], None, None]:
         """
         Fetch all conversations, handling pagination.
@@ -114,6 +157,13 @@ class HelpScoutAPI:
             created_to: Optional datetime to filter conversations created before this time
             tags: Optional list of tags to filter conversations
             status: Conversation status filter ('all', 'active', 'closed', 'open', 'pending', 'spam')
+            mailbox_id: Optional mailbox ID to restrict the export to
+            confirm: Ask for confirmation before downloading
+            on_progress: Optional callback receiving (processed, total) instead of
+                printing progress to the console
+            on_failure: Optional callback receiving (conversation_id, error) when a
+                conversation can't be fetched. The export skips it and carries on
+                instead of raising.
             
         Yields:
             Dict containing conversation data with embedded threads
@@ -145,6 +195,9 @@ class HelpScoutAPI:
         if tags:
             params['tag'] = ','.join(tags)
 
+        if mailbox_id is not None:
+            params['mailbox'] = mailbox_id
+
         total_conversations = 0
         processed_conversations = 0
 
@@ -152,8 +205,7 @@ class HelpScoutAPI:
             # Build and print the full request URL
             url = f'{self.BASE_URL}/conversations'
             
-            response = self.session.get(url, params=params)
-            response = self._handle_response(response)
+            response = self._get(url, params=params)
             
             if response.status_code == 429:  # Rate limit hit
                 retry_after = int(response.headers.get('Retry-After', 60))
@@ -166,26 +218,40 @@ class HelpScoutAPI:
             # Get total on first page
             if params['page'] == 1:
                 total_conversations = data['page']['totalElements']
-                print(f'Found {total_conversations} matching conversations')
-                print(f'Using query: {created_query}')
+                if on_progress:
+                    on_progress(0, total_conversations)
+                else:
+                    print(f'Found {total_conversations} matching conversations')
+                    print(f'Using query: {created_query}')
                 # Return early if no conversations found
                 if total_conversations == 0:
                     return
                 # Ask for confirmation before proceeding
-                if not click.confirm('Do you want to proceed with downloading?'):
+                if confirm and not click.confirm('Do you want to proceed with downloading?'):
                     return
             
             # Yield each conversation
             for conversation in data['_embedded']['conversations']:
                 processed_conversations += 1
                 # Fetch full conversation details with threads
-                conv_details = self.get_conversation_details(conversation['id'])
-                print(f'Processing conversation {processed_conversations}/{total_conversations}', end='\r')
-                yield conv_details
+                try:
+                    conv_details = self.get_conversation_details(conversation['id'])
+                except requests.exceptions.RequestException as e:
+                    if not on_failure:
+                        raise
+                    on_failure(conversation['id'], e)
+                    conv_details = None
+                if on_progress:
+                    on_progress(processed_conversations, total_conversations)
+                else:
+                    print(f'Processing conversation {processed_conversations}/{total_conversations}', end='\r')
+                if conv_details is not None:
+                    yield conv_details
             
             # Check if there are more pages
             if data['page']['number'] >= data['page']['totalPages']:
-                print()  # New line after progress
+                if not on_progress:
+                    print()  # New line after progress
                 break
                 
             params['page'] += 1
@@ -203,11 +269,10 @@ class HelpScoutAPI:
         params = {'embed': 'threads'}
         
         while True:
-            response = self.session.get(
+            response = self._get(
                 f'{self.BASE_URL}/conversations/{conversation_id}',
                 params=params
             )
-            response = self._handle_response(response)
             
             if response.status_code == 429:  # Rate limit hit
                 retry_after = int(response.headers.get('Retry-After', 60))
@@ -228,8 +293,7 @@ class HelpScoutAPI:
         all_tags = []
 
         while True:
-            response = self.session.get(f'{self.BASE_URL}/tags', params=params)
-            response = self._handle_response(response)
+            response = self._get(f'{self.BASE_URL}/tags', params=params)
             
             if response.status_code == 429:  # Rate limit hit
                 retry_after = int(response.headers.get('Retry-After', 60))
@@ -319,7 +383,7 @@ def print_token():
 )
 @click.option(
     '--status',
-    type=click.Choice(['all', 'active', 'closed', 'open', 'pending', 'spam'], 
+    type=click.Choice(CONVERSATION_STATUSES, 
                       case_sensitive=False),
     default='all',
     help='Filter by conversation status'
@@ -369,115 +433,129 @@ def fetch_conversations(
         print()
         
         saved_count = 0
+        failures = FailureLog(output_dir)
         # Fetch and save conversations
         for conversation in api.get_conversations(
             created_from=created_from,
             created_to=created_to,
             tags=tag_list,
-            status=status
+            status=status,
+            on_failure=failures.record
         ):
             # Save each conversation to a JSON file
-            filename = f'{output_dir}/conversation_{conversation["id"]}.json'
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(conversation, f, indent=2, ensure_ascii=False)
-            
+            save_conversation(output_dir, conversation)
             saved_count += 1
             
         print(f'\nSuccessfully saved {saved_count} conversations to {output_dir}/')
+        print_failure_hint(failures, output_dir)
             
     except requests.exceptions.RequestException as e:
         print(f'Error fetching conversations: {e}')
         raise
 
-@cli.command(name='export')
-@click.option(
-    '--from',
-    'created_from',
-    required=True,
-    type=click.DateTime(),
-    help='Filter conversations created after this date (format: YYYY-MM-DD)'
-)
-@click.option(
-    '--to',
-    'created_to',
-    required=False,
-    type=click.DateTime(),
-    help='Filter conversations created before this date (format: YYYY-MM-DD)'
-)
-@click.option(
-    '--tag',
-    'tags',
-    multiple=True,
-    help='Filter by tag. Can be specified multiple times. Supports quoted strings.'
-)
-@click.option(
-    '--status',
-    type=click.Choice(['all', 'active', 'closed', 'open', 'pending', 'spam'], 
-                      case_sensitive=False),
-    default='all',
-    help='Filter by conversation status'
-)
-def export_conversations(
-    created_from: datetime,
-    created_to: Optional[datetime],
-    tags: tuple[str, ...],
-    status: str
-):
-    """Fetch, save, and analyze Help Scout conversations in one step."""
-    # Get credentials
-    client_id, client_secret = get_credentials()
-
-    # Initialize API client
-    api = HelpScoutAPI(client_id, client_secret)
+class FailureLog:
+    """Dead-letter file recording conversations that could not be fetched."""
     
-    # Create timestamped output directory
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    tag_suffix = "_".join(tags).replace(" ", "-")[:30] if tags else ""
+    FILENAME = 'failed.jsonl'
     
-    # Create parent exports directory if it doesn't exist
-    exports_dir = "exports"
-    os.makedirs(exports_dir, exist_ok=True)
-    
-    # Create subdirectory for this export
-    if tag_suffix:
-        output_dir = f"{exports_dir}/{timestamp}_{tag_suffix}"
-    else:
-        output_dir = f"{exports_dir}/{timestamp}"
+    def __init__(self, output_dir: str):
+        self.path = os.path.join(output_dir, self.FILENAME)
+        self.count = 0
+        self._lock = threading.Lock()
     
-    os.makedirs(output_dir, exist_ok=True)
+    @staticmethod
+    def make_entry(conversation_id: int, error: Exception, attempts: int = 1) -> Dict[str, Any]:
+        """Build a dead-letter entry for a failed conversation."""
+        response = getattr(error, 'response', None)
+        return {
+            'id': conversation_id,
+            'error': str(error) or type(error).__name__,
+            'status_code': response.status_code if response is not None else None,
+            'attempts': attempts,
+            'failed_at': datetime.now(timezone.utc).isoformat()
+        }
     
-    # Print filter information
-    print(f'Exporting conversations:')
-    print(f'  From: {created_from.isoformat()}')
-    if created_to:
-        print(f'  To: {created_to.isoformat()}')
-    if tags:
-        print(f'  Tags: {", ".join(tags)}')
-    print(f'  Status: {status}')
-    print()
+    def record(self, conversation_id: int, error: Exception, attempts: int = 1):
+        """Append a failed conversation ID and its error to the dead-letter file."""
+        entry = self.make_entry(conversation_id, error, attempts)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+            self.count += 1
     
-    # Fetch and save conversations
-    saved_count = 0
-    for conversation in api.get_conversations(
-        created_from=created_from,
-        created_to=created_to,
-        tags=list(tags) if tags else None,
-        status=status
-    ):
-        # Save each conversation to a JSON file
-        filename = f'{output_dir}/conversation_{conversation["id"]}.json'
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(conversation, f, indent=2, ensure_ascii=False)
+    def load(self) -> list[Dict[str, Any]]:
+        """Read all recorded failures, or an empty list if there are none.
         
-        saved_count += 1
+        Lines that can't be parsed, such as one cut off by a killed process,
+        are skipped with a warning.
+        """
+        entries = []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        entry = None
+                    if not isinstance(entry, dict) or 'id' not in entry:
+                        print(f'Warning: skipping unreadable line {line_number} in {self.path}')
+                        continue
+                    entries.append(entry)
+        except FileNotFoundError:
+            pass
+        return entries
     
-    if saved_count == 0:
-        print("No conversations found matching your criteria.")
+    def replace(self, entries: list[Dict[str, Any]]):
+        """Atomically replace the dead-letter file with entries, removing it if empty."""
+        with self._lock:
+            if entries:
+                tmp_path = f'{self.path}.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    for entry in entries:
+                        f.write(json.dumps(entry) + '\n')
+                os.replace(tmp_path, self.path)
+            elif os.path.exists(self.path):
+                os.remove(self.path)
+            self.count = len(entries)
+
+def print_failure_hint(failures: FailureLog, output_dir: str):
+    """Tell the user about skipped conversations and how to retry them."""
+    if not failures.count:
         return
-        
-    print(f'\nSaved {saved_count} conversations to {output_dir}/')
-    
-    # Generate CSV summary
+    print(f'{failures.count} conversations could not be fetched and were recorded in {failures.path}')
+    print(f"Run 'python main.py retry-failed --output-dir {output_dir}' to retry them.")
+
+EXPORT_INFO_FILENAME = 'export_info.json'
+
+def write_export_info(output_dir: str, **details: Any):
+    """Mark output_dir as an export directory whose summary.csv should be kept up to date."""
+    info = {'created_at': datetime.now(timezone.utc).isoformat(), **details}
+    with open(os.path.join(output_dir, EXPORT_INFO_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(info, f, indent=2, default=str)
+
+def is_export_dir(output_dir: str) -> bool:
+    """Check whether output_dir was created by export or batch-export."""
+    # Older exports have no info file but always have a summary
+    return any(
+        os.path.exists(os.path.join(output_dir, filename))
+        for filename in (EXPORT_INFO_FILENAME, 'summary.csv')
+    )
+
+def save_conversation(output_dir: str, conversation: Dict[str, Any]) -> str:
+    """Save a single conversation as a JSON file and return its path."""
+    filename = f'{output_dir}/conversation_{conversation["id"]}.json'
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(conversation, f, indent=2, ensure_ascii=False)
+    return filename
+
+def write_summary_csv(output_dir: str) -> int:
+    """Build summary.csv from the conversation JSON files in output_dir.
+
+    Returns:
+        Number of conversations written to the CSV
+    """
     csv_filename = f"{output_dir}/summary.csv"
     
     # Prepare CSV headers for conversation-level summary
@@ -496,7 +574,7 @@ def export_conversations(
     conversation_summaries = []
     
     for filename in os.listdir(output_dir):
-        if not filename.endswith('.json'):
+        if not (filename.startswith('conversation_') and filename.endswith('.json')):
             continue
             
         filepath = os.path.join(output_dir, filename)
@@ -576,9 +654,553 @@ def export_conversations(
         writer.writeheader()
         writer.writerows(conversation_summaries)
     
-    print(f'Created summary CSV with {len(conversation_summaries)} conversations: {csv_filename}')
+    return len(conversation_summaries)
+
+@cli.command(name='export')
+@click.option(
+    '--from',
+    'created_from',
+    required=True,
+    type=click.DateTime(),
+    help='Filter conversations created after this date (format: YYYY-MM-DD)'
+)
+@click.option(
+    '--to',
+    'created_to',
+    required=False,
+    type=click.DateTime(),
+    help='Filter conversations created before this date (format: YYYY-MM-DD)'
+)
+@click.option(
+    '--tag',
+    'tags',
+    multiple=True,
+    help='Filter by tag. Can be specified multiple times. Supports quoted strings.'
+)
+@click.option(
+    '--status',
+    type=click.Choice(CONVERSATION_STATUSES, 
+                      case_sensitive=False),
+    default='all',
+    help='Filter by conversation status'
+)
+def export_conversations(
+    created_from: datetime,
+    created_to: Optional[datetime],
+    tags: tuple[str, ...],
+    status: str
+):
+    """Fetch, save, and analyze Help Scout conversations in one step."""
+    # Get credentials
+    client_id, client_secret = get_credentials()
+
+    # Initialize API client
+    api = HelpScoutAPI(client_id, client_secret)
+    
+    # Create timestamped output directory
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    tag_suffix = "_".join(tags).replace(" ", "-")[:30] if tags else ""
+    
+    # Create parent exports directory if it doesn't exist
+    exports_dir = "exports"
+    os.makedirs(exports_dir, exist_ok=True)
+    
+    # Create subdirectory for this export
+    if tag_suffix:
+        output_dir = f"{exports_dir}/{timestamp}_{tag_suffix}"
+    else:
+        output_dir = f"{exports_dir}/{timestamp}"
+    
+    os.makedirs(output_dir, exist_ok=True)
+    write_export_info(
+        output_dir,
+        created_from=created_from,
+        created_to=created_to,
+        tags=list(tags),
+        status=status
+    )
+    
+    # Print filter information
+    print(f'Exporting conversations:')
+    print(f'  From: {created_from.isoformat()}')
+    if created_to:
+        print(f'  To: {created_to.isoformat()}')
+    if tags:
+        print(f'  Tags: {", ".join(tags)}')
+    print(f'  Status: {status}')
+    print()
+    
+    # Fetch and save conversations
+    saved_count = 0
+    failures = FailureLog(output_dir)
+    for conversation in api.get_conversations(
+        created_from=created_from,
+        created_to=created_to,
+        tags=list(tags) if tags else None,
+        status=status,
+        on_failure=failures.record
+    ):
+        # Save each conversation to a JSON file
+        save_conversation(output_dir, conversation)
+        saved_count += 1
+    
+    if saved_count == 0:
+        if failures.count:
+            print_failure_hint(failures, output_dir)
+        else:
+            print("No conversations found matching your criteria.")
+        return
+        
+    print(f'\nSaved {saved_count} conversations to {output_dir}/')
+    print_failure_hint(failures, output_dir)
+    
+    # Generate CSV summary
+    csv_filename = f"{output_dir}/summary.csv"
+    summary_count = write_summary_csv(output_dir)
+    
+    print(f'Created summary CSV with {summary_count} conversations: {csv_filename}')
     print(f'\nAnalysis complete! You can find all files in the {output_dir}/ directory.')
 
+BATCH_NAME_PATTERN = re.compile(r'^(?!\.+$)[A-Za-z0-9_.-]+$')
+
+def load_batch_config(config_path: str) -> list[Dict[str, Any]]:
+    """
+    Load and validate a batch export config file.
+    
+    The file is JSON with an "exports" list. Each entry needs a unique "name"
+    and may set "app_id", "app_secret", "mailbox_id", "tags", "status" and
+    "requests_per_minute". Missing credentials fall back to the .env values.
+    
+    Returns:
+        List of export job definitions
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        try:
+            config = json.load(f)
+        except json.JSONDecodeError as e:
+            raise click.ClickException(f'{config_path} is not valid JSON: {e}')
+    
+    if not isinstance(config, dict):
+        raise click.ClickException(f'{config_path} must contain a JSON object with an "exports" list')
+    
+    jobs = config.get('exports', [])
+    if not isinstance(jobs, list) or not jobs:
+        raise click.ClickException(f'No exports defined in {config_path}')
+    
+    seen_names = set()
+    for job in jobs:
+        if not isinstance(job, dict):
+            raise click.ClickException('Every export in the batch config must be a JSON object')
+        
+        # Names are used in file paths, so keep them to safe characters
+        name = job.get('name')
+        if not isinstance(name, str) or not BATCH_NAME_PATTERN.match(name):
+            raise click.ClickException(
+                f'Invalid export name {name!r}: use only letters, digits, "_", "-" and "."'
+            )
+        if name in seen_names:
+            raise click.ClickException(f'Duplicate export name in batch config: {name}')
+        seen_names.add(name)
+        
+        job.setdefault('app_id', os.getenv('HELPSCOUT_APP_ID'))
+        job.setdefault('app_secret', os.getenv('HELPSCOUT_APP_SECRET'))
+        if not all([job['app_id'], job['app_secret']]):
+            raise click.ClickException(f'Export "{name}" has no app_id/app_secret configured')
+        
+        job.setdefault('status', 'all')
+        if job['status'] not in CONVERSATION_STATUSES:
+            raise click.ClickException(
+                f'Export "{name}" has invalid status {job["status"]!r}; '
+                f'expected one of: {", ".join(CONVERSATION_STATUSES)}'
+            )
+        
+        job.setdefault('tags', [])
+        if not isinstance(job['tags'], list) or not all(isinstance(t, str) for t in job['tags']):
+            raise click.ClickException(f'Export "{name}" must list "tags" as an array of strings')
+        
+        rate = job.get('requests_per_minute')
+        if rate is not None and (isinstance(rate, bool) or not isinstance(rate, int) or rate < 1):
+            raise click.ClickException(f'Export "{name}" needs a positive integer for "requests_per_minute"')
+        
+        mailbox_id = job.get('mailbox_id')
+        if mailbox_id is not None:
+            if isinstance(mailbox_id, str) and mailbox_id.isdigit():
+                mailbox_id = int(mailbox_id)
+            if isinstance(mailbox_id, bool) or not isinstance(mailbox_id, int) or mailbox_id < 1:
+                raise click.ClickException(
+                    f'Export "{name}" needs a positive integer for "mailbox_id", got {job["mailbox_id"]!r}'
+                )
+            job['mailbox_id'] = mailbox_id
+    
+    return jobs
+
+class BatchCancelled(Exception):
+    """Raised inside a batch job when the batch has been interrupted."""
+
+class BatchProgress:
+    """Combined single-line progress display for concurrently running exports."""
+    
+    def __init__(self, names: list[str]):
+        self._lock = threading.Lock()
+        self._state = {name: 'waiting' for name in names}
+    
+    def update(self, name: str, state: str):
+        with self._lock:
+            self._state[name] = state
+            line = ' | '.join(f'{n}: {s}' for n, s in self._state.items())
+            # Stay on one terminal row so '\r' can redraw it
+            width = shutil.get_terminal_size().columns - 1
+            print(line[:width].ljust(width), end='\r', flush=True)
+
+def run_batch_job(
+    job: Dict[str, Any],
+    output_dir: str,
+    created_from: datetime,
+    created_to: Optional[datetime],
+    progress: BatchProgress,
+    cancel_event: threading.Event
+) -> Dict[str, Any]:
+    """
+    Run a single export from a batch config into its own output directory.
+    
+    The job stops at the next conversation once cancel_event is set.
+    
+    Returns:
+        Dict with the job name, output directory, saved count and any error
+    """
+    name = job['name']
+    result = {'name': name, 'output_dir': output_dir, 'saved': 0, 'failed': 0, 'error': None}
+    failures = FailureLog(output_dir)
+    
+    def report_progress(done: int, total: int):
+        if cancel_event.is_set():
+            raise BatchCancelled('cancelled')
+        progress.update(name, f'{done}/{total}')
+    
+    try:
+        if cancel_event.is_set():
+            raise BatchCancelled('cancelled')
+        
+        # Each job gets its own token cache and request budget
+        api = HelpScoutAPI(
+            job['app_id'],
+            job['app_secret'],
+            token_file=f'.helpscout_token.{name}.json',
+            requests_per_minute=job.get('requests_per_minute')
+        )
+        os.makedirs(output_dir, exist_ok=True)
+        write_export_info(
+            output_dir,
+            name=name,
+            created_from=created_from,
+            created_to=created_to,
+            tags=job['tags'],
+            status=job['status'],
+            mailbox_id=job.get('mailbox_id')
+        )
+        
+        for conversation in api.get_conversations(
+            created_from=created_from,
+            created_to=created_to,
+            tags=job['tags'] or None,
+            status=job['status'],
+            mailbox_id=job.get('mailbox_id'),
+            confirm=False,
+            on_progress=report_progress,
+            on_failure=failures.record
+        ):
+            save_conversation(output_dir, conversation)
+            result['saved'] += 1
+        
+        if result['saved']:
+            write_summary_csv(output_dir)
+        progress.update(name, f'done ({result["saved"]})')
+    except BatchCancelled:
+        result['error'] = 'cancelled'
+        progress.update(name, 'cancelled')
+    except Exception as e:
+        # Report any failure in the summary rather than aborting the other jobs
+        result['error'] = str(e) or type(e).__name__
+        progress.update(name, 'failed')
+    finally:
+        result['failed'] = failures.count
+    
+    return result
+
+@cli.command(name='batch-export')
+@click.option(
+    '--config',
+    'config_path',
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help='JSON file listing the accounts/mailboxes to export'
+)
+@click.option(
+    '--from',
+    'created_from',
+    required=True,
+    type=click.DateTime(),
+    help='Filter conversations created after this date (format: YYYY-MM-DD)'
+)
+@click.option(
+    '--to',
+    'created_to',
+    required=False,
+    type=click.DateTime(),
+    help='Filter conversations created before this date (format: YYYY-MM-DD)'
+)
+@click.option(
+    '--workers',
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Maximum number of exports to run at the same time'
+)
+def batch_export(
+    config_path: str,
+    created_from: datetime,
+    created_to: Optional[datetime],
+    workers: int
+):
+    """Export several Help Scout accounts or mailboxes in parallel."""
+    jobs = load_batch_config(config_path)
+    
+    # Each job writes into its own namespace under a shared batch directory
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    batch_dir = f"exports/{timestamp}_batch"
+    os.makedirs(batch_dir, exist_ok=True)
+    
+    print(f'Running {len(jobs)} exports:')
+    print(f'  From: {created_from.isoformat()}')
+    if created_to:
+        print(f'  To: {created_to.isoformat()}')
+    print()
+    
+    progress = BatchProgress([job['name'] for job in jobs])
+    cancel_event = threading.Event()
+    interrupted = False
+    
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = {
+        executor.submit(
+            run_batch_job,
+            job,
+            f"{batch_dir}/{job['name']}",
+            created_from,
+            created_to,
+            progress,
+            cancel_event
+        ): job
+        for job in jobs
+    }
+    try:
+        for future in as_completed(futures):
+            future.result()
+    except KeyboardInterrupt:
+        # Let running jobs stop at their next conversation and drop queued ones
+        interrupted = True
+        cancel_event.set()
+        print('\nInterrupted, stopping running exports...')
+        executor.shutdown(wait=True, cancel_futures=True)
+    finally:
+        executor.shutdown(wait=True)
+    
+    results = []
+    for future, job in futures.items():
+        if future.cancelled():
+            results.append({
+                'name': job['name'],
+                'output_dir': f"{batch_dir}/{job['name']}",
+                'saved': 0,
+                'failed': 0,
+                'error': 'cancelled'
+            })
+        else:
+            results.append(future.result())
+    
+    print()
+    print(f'\n{"EXPORT":<30} {"SAVED":>8} {"FAILED":>8}  RESULT')
+    print('-' * 80)
+    for result in sorted(results, key=lambda r: r['name']):
+        outcome = f'error: {result["error"]}' if result['error'] else result['output_dir']
+        print(f'{result["name"]:<30} {result["saved"]:>8} {result["failed"]:>8}  {outcome}')
+    
+    total_saved = sum(r['saved'] for r in results)
+    failed = [r for r in results if r['error']]
+    print(f'\nSaved {total_saved} conversations across {len(results)} exports to {batch_dir}/')
+    with_failures = [r for r in results if r['failed']]
+    if with_failures:
+        print('Some conversations could not be fetched. To retry them, run:')
+        for result in sorted(with_failures, key=lambda r: r['name']):
+            print(
+                f"  python main.py retry-failed --output-dir {result['output_dir']} "
+                f"--config {config_path} --name {result['name']}"
+            )
+    if interrupted:
+        print('Batch export was interrupted.')
+        sys.exit(130)
+    if failed:
+        print(f'{len(failed)} export(s) failed.')
+        sys.exit(1)
+
+def fetch_with_retries(
+    api: HelpScoutAPI,
+    conversation_id: int,
+    attempts: int,
+    cancel_event: Optional[threading.Event] = None
+) -> tuple[Optional[Dict[str, Any]], Optional[Exception], int]:
+    """
+    Fetch a single conversation, retrying transient errors with backoff.
+    
+    Client errors such as 404 are not retried since they won't succeed later.
+    Any other error, including unexpected response bodies, is retried and then
+    returned rather than raised so one bad ID can't abort the whole retry.
+    Backoff waits end early once cancel_event is set.
+    
+    Returns:
+        Tuple of (conversation or None, last error or None, attempts made)
+    """
+    last_error = None
+    for attempt in range(1, attempts + 1):
+        try:
+            return api.get_conversation_details(conversation_id), None, attempt
+        except Exception as e:
+            last_error = e
+            response = getattr(e, 'response', None)
+            if response is not None and 400 <= response.status_code < 500:
+                return None, e, attempt
+            if attempt < attempts:
+                if cancel_event is None:
+                    time.sleep(2 ** attempt)
+                elif cancel_event.wait(2 ** attempt):
+                    return None, e, attempt
+    return None, last_error, attempts
+
+@cli.command(name='retry-failed')
+@click.option(
+    '--output-dir',
+    required=True,
+    type=click.Path(exists=True, file_okay=False),
+    help='Export directory containing the failed.jsonl to retry'
+)
+@click.option(
+    '--attempts',
+    default=3,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Maximum attempts per conversation'
+)
+@click.option(
+    '--workers',
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Number of conversations to fetch at the same time'
+)
+@click.option(
+    '--config',
+    'config_path',
+    required=False,
+    type=click.Path(exists=True, dir_okay=False),
+    help='Batch config to take credentials from (use with --name)'
+)
+@click.option(
+    '--name',
+    required=False,
+    help='Name of the batch export whose credentials should be used'
+)
+def retry_failed(
+    output_dir: str,
+    attempts: int,
+    workers: int,
+    config_path: Optional[str],
+    name: Optional[str]
+):
+    """Re-fetch only the conversations recorded as failed in an export directory."""
+    if bool(config_path) != bool(name):
+        raise click.ClickException('--config and --name must be used together')
+    
+    failures = FailureLog(output_dir)
+    entries = failures.load()
+    if not entries:
+        print(f'No failed conversations recorded in {output_dir}/')
+        return
+    
+    if config_path:
+        jobs = {job['name']: job for job in load_batch_config(config_path)}
+        if not name or name not in jobs:
+            raise click.ClickException(f'--name must match an export in {config_path}')
+        job = jobs[name]
+        api = HelpScoutAPI(
+            job['app_id'],
+            job['app_secret'],
+            token_file=f'.helpscout_token.{name}.json',
+            requests_per_minute=job.get('requests_per_minute')
+        )
+    else:
+        client_id, client_secret = get_credentials()
+        api = HelpScoutAPI(client_id, client_secret)
+    
+    # The same ID may have been recorded more than once across runs; keep the
+    # latest entry for each
+    latest_entries = {entry['id']: entry for entry in entries}
+    conversation_ids = list(latest_entries)
+    print(f'Retrying {len(conversation_ids)} failed conversations from {failures.path}')
+    
+    # The original dead-letter file is kept until every ID has been retried,
+    # so an interrupted run can simply be started again
+    still_failing = []
+    handled_ids = set()
+    recovered = 0
+    cancel_event = threading.Event()
+    
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = {
+        executor.submit(fetch_with_retries, api, conversation_id, attempts, cancel_event): conversation_id
+        for conversation_id in conversation_ids
+    }
+    try:
+        for future in as_completed(futures):
+            conversation_id = futures[future]
+            conversation, error, attempts_made = future.result()
+            if conversation is not None:
+                try:
+                    save_conversation(output_dir, conversation)
+                    recovered += 1
+                except OSError as e:
+                    still_failing.append(FailureLog.make_entry(conversation_id, e, attempts_made))
+            else:
+                still_failing.append(FailureLog.make_entry(conversation_id, error, attempts_made))
+            handled_ids.add(conversation_id)
+            print(f'Processing conversation {len(handled_ids)}/{len(conversation_ids)}', end='\r')
+    except KeyboardInterrupt:
+        # Drop queued retries, then keep everything that wasn't resolved
+        cancel_event.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        unattempted = [
+            latest_entries[conversation_id]
+            for conversation_id in conversation_ids
+            if conversation_id not in handled_ids
+        ]
+        failures.replace(still_failing + unattempted)
+        print(f'\nInterrupted; {failures.count} conversations left in {failures.path}')
+        raise
+    finally:
+        executor.shutdown(wait=True)
+    
+    failures.replace(still_failing)
+    
+    print()
+    print(f'\nRecovered {recovered} of {len(conversation_ids)} conversations into {output_dir}/')
+    
+    # Keep the export's summary in step with the recovered conversations
+    if recovered and is_export_dir(output_dir):
+        summary_count = write_summary_csv(output_dir)
+        print(f'Updated summary CSV with {summary_count} conversations: {output_dir}/summary.csv')
+    
+    if failures.count:
+        print(f'{failures.count} conversations still failing; see {failures.path}')
+
 @cli.command(name='setup')
 def setup_credentials():
     """Interactive setup to configure your Help Scout API credentials."""